@@ -1,1020 +1,1495 @@
-"""
-Media Downloader Pro - Main Application File
-Optimized for fast startup with background FFmpeg check
-"""
-
-import sys
-import os
-import platform
-import subprocess
-import urllib.request
-import zipfile
-import tempfile
-import shutil
-import yt_dlp
-from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QTextEdit, QPushButton, QProgressBar,
-    QFileDialog, QMessageBox, QGroupBox,
-    QComboBox, QCheckBox, QAction, QActionGroup, QScrollArea, QDialog
-)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTranslator, QLocale, QTimer
-from PyQt5.QtGui import QFont, QIcon, QTextOption, QColor, QPalette
-
-class FFmpegManager(QThread):
-    """Handles FFmpeg installation and verification in background"""
-    status_changed = pyqtSignal(str, str)  # status, message
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.ffmpeg_path = None
-        self.install_status = "checking"
-        self.platform = platform.system().lower()
-        self.parent = parent
-    
-    def run(self):
-        """Run in background thread"""
-        self.find_ffmpeg()
-        
-    def find_ffmpeg(self):
-        """Try to find FFmpeg in system PATH or common locations"""
-        try:
-            # First quick check if ffmpeg is in PATH
-            ffmpeg_path = shutil.which("ffmpeg")
-            if ffmpeg_path:
-                self.ffmpeg_path = ffmpeg_path
-                self.install_status = "installed"
-                self.status_changed.emit("installed", "FFmpeg ready")
-                return True
-            
-            # More thorough check in background
-            if self.platform == "windows":
-                common_paths = [
-                    os.path.join(os.environ.get("ProgramFiles", ""), "FFmpeg", "bin", "ffmpeg.exe"),
-                    os.path.join(os.environ.get("ProgramFiles(x86)", ""), "FFmpeg", "bin", "ffmpeg.exe"),
-                    os.path.join(os.getcwd(), "ffmpeg", "bin", "ffmpeg.exe")
-                ]
-            else:  # Linux/Mac
-                common_paths = [
-                    "/usr/local/bin/ffmpeg",
-                    "/usr/bin/ffmpeg",
-                    os.path.join(os.path.expanduser("~"), "bin", "ffmpeg")
-                ]
-            
-            for path in common_paths:
-                if os.path.exists(path):
-                    self.ffmpeg_path = path
-                    self.install_status = "installed"
-                    self.status_changed.emit("installed", "FFmpeg ready")
-                    return True
-            
-            # If not found, attempt download (Windows only)
-            if self.platform == "windows":
-                self.status_changed.emit("downloading", "Downloading FFmpeg...")
-                if self.download_ffmpeg():
-                    self.status_changed.emit("installed", "FFmpeg ready")
-                    return True
-            
-            self.install_status = "missing"
-            self.status_changed.emit("missing", "FFmpeg missing")
-            return False
-            
-        except Exception as e:
-            print(f"Error finding FFmpeg: {e}")
-            self.install_status = "missing"
-            self.status_changed.emit("missing", "FFmpeg check failed")
-            return False
-    
-    def download_ffmpeg(self):
-        """Download FFmpeg for Windows"""
-        try:
-            url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
-            temp_dir = tempfile.mkdtemp()
-            archive_path = os.path.join(temp_dir, "ffmpeg.zip")
-            
-            # Download with progress feedback
-            def report_progress(block_num, block_size, total_size):
-                percent = min(int(block_num * block_size * 100 / total_size), 100)
-                self.status_changed.emit("downloading", f"Downloading FFmpeg... {percent}%")
-            
-            urllib.request.urlretrieve(url, archive_path, reporthook=report_progress)
-            
-            # Extract
-            extract_dir = os.path.join(os.getcwd(), "ffmpeg")
-            os.makedirs(extract_dir, exist_ok=True)
-            
-            with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            # Find the binary
-            for root, dirs, files in os.walk(extract_dir):
-                if "ffmpeg.exe" in files:
-                    self.ffmpeg_path = os.path.join(root, "ffmpeg.exe")
-                    self.install_status = "installed"
-                    
-                    # Add to PATH for this session
-                    os.environ["PATH"] = os.path.dirname(self.ffmpeg_path) + os.pathsep + os.environ.get("PATH", "")
-                    
-                    shutil.rmtree(temp_dir)
-                    return True
-            
-            return False
-                
-        except Exception as e:
-            print(f"Error downloading FFmpeg: {e}")
-            return False
-
-class DownloadThread(QThread):
-    """
-    A QThread subclass that handles the actual downloading process in the background.
-    """
-    update_progress = pyqtSignal(int, str)
-    finished = pyqtSignal()
-
-    def __init__(self, urls, download_folder, format_type, ffmpeg_path):
-        super().__init__()
-        self.urls = urls
-        self.download_folder = download_folder
-        self.format_type = format_type
-        self.ffmpeg_path = ffmpeg_path
-        self.is_running = True
-        self.ydl = None
-
-    def run(self):
-        for i, url in enumerate(self.urls):
-            if not self.is_running:
-                break
-
-            self.update_progress.emit(0, self.tr("Processing: %s") % url)
-            
-            try:
-                ydl_opts = self.build_ytdlp_options()
-                with yt_dlp.YoutubeDL(ydl_opts) as self.ydl:
-                    self.ydl.add_progress_hook(self.progress_hook)
-                    self.ydl.download([url])
-                    
-                self.update_progress.emit(100, f"✔ {self.tr('Finished: %s') % url}")
-                
-            except Exception as e:
-                self.update_progress.emit(0, f"❌ {self.tr('Error: %s') % str(e)}")
-
-        self.finished.emit()
-
-    def progress_hook(self, d):
-        if d['status'] == 'downloading':
-            progress = d.get('_percent_str', '0%').replace('%', '')
-            try:
-                progress_int = int(float(progress))
-                self.update_progress.emit(
-                    progress_int,
-                    self.tr("Downloading: %s") % d.get('filename', '')
-                )
-            except (ValueError, TypeError):
-                pass
-
-    def build_ytdlp_options(self):
-        opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'outtmpl': os.path.join(self.download_folder, '%(title)s.%(ext)s'),
-            'noplaylist': True,
-            'ignoreerrors': True,
-            'ffmpeg_location': self.ffmpeg_path if self.ffmpeg_path else None,
-        }
-
-        if self.format_type.startswith("mp3"):
-            opts.update({
-                'format': 'bestaudio/best',
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '320' if self.format_type == "mp3_320" else '192',
-                }],
-                'keepvideo': False,
-            })
-        elif self.format_type.startswith("mp4"):
-            height_map = {
-                'mp4_720': '720',
-                'mp4_1080': '1080',
-                'mp4_best': 'best'
-            }
-            height = height_map.get(self.format_type, 'best')
-            
-            if height == 'best':
-                opts['format'] = 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best'
-            else:
-                opts['format'] = f'bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]/best[height<={height}][ext=mp4]/best'
-            
-            opts['merge_output_format'] = 'mp4'
-
-        return opts
-
-    def stop(self):
-        self.is_running = False
-        if self.ydl:
-            self.ydl.cancel_download()
-        if self.isRunning():
-            self.requestInterruption()
-            self.wait(2000)
-
-class LicenseDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle(self.tr("GPL License"))
-        self.setMinimumSize(700, 500)
-        
-        # Hauptlayout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(10)
-        
-        # ScrollArea
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        
-        # Container für Lizenztext
-        self.text_container = QWidget()
-        self.text_layout = QVBoxLayout(self.text_container)
-        self.text_layout.setContentsMargins(15, 15, 15, 15)
-        
-        # Lizenztext-Label
-        self.license_label = QLabel()
-        self.license_label.setTextFormat(Qt.PlainText)
-        self.license_label.setWordWrap(True)
-        self.license_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        self.license_label.setFont(QFont("Consolas", 10))
-        
-        self.text_layout.addWidget(self.license_label)
-        scroll.setWidget(self.text_container)
-        
-        # OK-Button
-        self.btn_ok = QPushButton("OK")
-        self.btn_ok.clicked.connect(self.accept)
-        self.btn_ok.setFixedWidth(100)
-        
-        layout.addWidget(scroll)
-        layout.addWidget(self.btn_ok, alignment=Qt.AlignRight)
-        
-        self.load_license_text()
-        self.apply_theme(parent.dark_mode if parent else False)
-
-    def load_license_text(self):
-        try:
-            base_path = os.path.dirname(sys.argv[0])
-            license_path = os.path.join(base_path, "LICENSE.txt")
-            
-            if not os.path.exists(license_path) and hasattr(sys, '_MEIPASS'):
-                license_path = os.path.join(sys._MEIPASS, "LICENSE.txt")
-            
-            if os.path.exists(license_path):
-                with open(license_path, 'r', encoding='utf-8') as f:
-                    self.license_label.setText(f.read())
-            else:
-                self.license_label.setText("License file not found at: " + license_path)
-        except Exception as e:
-            self.license_label.setText(f"Error loading license: {str(e)}")
-
-    def apply_theme(self, dark_mode):
-        if dark_mode:
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #2d2d2d;
-                }
-                QScrollArea {
-                    background-color: #252525;
-                    border: 1px solid #444;
-                }
-                QLabel {
-                    color: #f0f0f0;
-                    background-color: #252525;
-                }
-                QPushButton {
-                    background-color: #555;
-                    color: white;
-                    border: 1px solid #666;
-                    padding: 5px;
-                    border-radius: 4px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #666;
-                }
-            """)
-            self.text_container.setStyleSheet("background-color: #252525;")
-        else:
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #ffffff;
-                }
-                QScrollArea {
-                    background-color: #f9f9f9;
-                    border: 1px solid #ddd;
-                }
-                QLabel {
-                    color: #333333;
-                    background-color: #f9f9f9;
-                }
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    border: 1px solid #45a049;
-                    padding: 5px;
-                    border-radius: 4px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-            """)
-            self.text_container.setStyleSheet("background-color: #f9f9f9;")
-
-class AboutDialog(QMessageBox):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle(self.tr("About Media Downloader Pro"))
-        
-        about_text = f"""
-        <h2>Media Downloader Pro</h2>
-        <p>{self.tr('A tool for downloading videos and audio from various platforms')}</p>
-        
-        <h3>{self.tr('Features')}</h3>
-        <ul>
-            <li>{self.tr('Download videos as MP4 in various qualities')}</li>
-            <li>{self.tr('Extract audio as MP3 with different bitrates')}</li>
-            <li>{self.tr('Batch download from multiple URLs')}</li>
-            <li>{self.tr('Progress tracking')}</li>
-            <li>{self.tr('Automatic FFmpeg integration')}</li>
-        </ul>
-        
-        <p><b>{self.tr('Author')}:</b> Jörg Schröder</p>
-        <p><b>Website:</b> <a href="https://github.com/xGohac/Media-Downloader-Pro">Media-Downloader-Pro</a></p>
-        <p><b>{self.tr('License')}:</b> GNU General Public License v3.0</p>
-        """
-        
-        self.setText(about_text)
-        self.setIcon(QMessageBox.Information)
-        
-        self.addButton(self.tr("View Full License"), QMessageBox.ActionRole)
-        self.buttonClicked.connect(self.on_button_click)
-        
-        self.apply_theme(parent.dark_mode if parent else True)
-
-    def on_button_click(self, button):
-        if button.text() == self.tr("View Full License"):
-            license_dialog = LicenseDialog(self.parent())
-            license_dialog.exec_()
-
-    def apply_theme(self, dark_mode):
-        if dark_mode:
-            self.setStyleSheet("""
-                QMessageBox {
-                    background-color: #2d2d2d;
-                }
-                QLabel {
-                    color: white;
-                }
-                QPushButton {
-                    min-width: 120px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QMessageBox {
-                    background-color: white;
-                }
-                QLabel {
-                    color: black;
-                }
-                QPushButton {
-                    min-width: 120px;
-                }
-            """)
-
-class YouTubeDownloaderApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.dark_mode = True
-        self.current_language = "en"
-        self.translator = QTranslator()
-        
-        self.setWindowTitle("Media Downloader Pro")
-        self.setGeometry(100, 100, 800, 600)
-        self.download_folder = os.path.expanduser("~/Downloads")
-        self.download_thread = None
-        self.show_log = False
-        
-        # Initialize FFmpeg manager
-        self.ffmpeg_manager = FFmpegManager(self)
-        self.ffmpeg_manager.status_changed.connect(self.update_ffmpeg_status)
-        
-        # Start FFmpeg check in background after short delay
-        QTimer.singleShot(100, self.ffmpeg_manager.start)
-
-        icon_path = os.path.join(os.path.dirname(__file__), "resources", "logo.ico")
-        if not os.path.exists(icon_path):
-            icon_path = ""
-        if icon_path:
-            self.setWindowIcon(QIcon(icon_path))
-            
-        self.init_ui()
-        self.apply_dark_theme()
-        self.load_language(self.current_language)
-
-    def update_ffmpeg_status(self, status, message):
-        """Update UI based on FFmpeg status (called from background thread)"""
-        color = QColor(255, 255, 255)
-        
-        if status == "checking":
-            color = QColor(200, 200, 0)
-        elif status == "downloading":
-            color = QColor(0, 0, 200)
-        elif status == "installed":
-            color = QColor(0, 200, 0)
-            self.download_btn.setEnabled(True)
-        elif status == "missing":
-            color = QColor(255, 0, 0)
-            self.download_btn.setEnabled(False)
-            self.log(self.tr("FFmpeg is required for audio conversion and video merging."), QColor(255, 165, 0))
-        
-        self.ffmpeg_status_label.setText(message)
-        self.ffmpeg_status_label.setStyleSheet(f"color: {color.name()};")
-        
-        if status == "missing" and "check failed" in message:
-            self.log(self.tr("FFmpeg check failed. Please install manually."), QColor(255, 0, 0))
-        
-        # Show additional info for errors
-        if status == "missing" and "check failed" in message:
-            self.log(self.tr("FFmpeg check failed. Please install manually."), QColor(255, 0, 0))
-
-    def toggle_theme(self):
-        self.dark_mode = not self.dark_mode
-        if self.dark_mode:
-            self.apply_dark_theme()
-        else:
-            self.apply_light_theme()
-        self.update_theme_button_text()
-        self.update()
-
-    def load_language(self, lang_code):
-        self.current_language = lang_code
-        QApplication.instance().removeTranslator(self.translator)
-        
-        if lang_code == "de":
-            translations = {
-                "Media Downloader Pro": "Media Downloader Pro",
-                "Enter Video/Audio URLs": "Video/Audio URLs eingeben",
-                "Paste one URL per line...": "Eine URL pro Zeile einfügen...",
-                "Download Options": "Download-Optionen",
-                "Quality:": "Qualität:",
-                "Save location: %s": "Speicherort: %s",
-                "Change folder": "Ordner ändern",
-                "Progress": "Fortschritt",
-                "Ready to start": "Bereit zum Starten",
-                "Show log": "Log anzeigen",
-                "Activity Log": "Aktivitätsprotokoll",
-                "Download Now": "Download starten",
-                "Cancel": "Abbrechen",
-                "Exit": "Beenden",
-                "File": "Datei",
-                "Language": "Sprache",
-                "Help": "Hilfe",
-                "About": "Über",
-                "Error": "Fehler",
-                "No URLs entered!": "Keine URLs eingegeben!",
-                "Download completed": "Download abgeschlossen",
-                "Download cancelled": "Download abgebrochen",
-                "A download is still active. Really quit?": "Ein Download ist noch aktiv. Wirklich beenden?",
-                "Download in progress": "Download läuft",
-                "Processing: %s": "Verarbeite: %s",
-                "Downloading: %s": "Download: %s",
-                "Finished: %s": "Fertig: %s",
-                "Error with: %s": "Fehler bei: %s",
-                "Error: %s": "Fehler: %s",
-                "Could not create folder: %s": "Ordner konnte nicht erstellt werden: %s",
-                "yt-dlp is not installed!": "yt-dlp ist nicht installiert!",
-                "Toggle light/dark mode": "Hell/Dunkel Modus wechseln",
-                "About Media Downloader Pro": "Über Media Downloader Pro",
-                "A tool for downloading videos and audio from various platforms": 
-                    "Ein Tool zum Herunterladen von Videos und Audio von verschiedenen Plattformen",
-                "Features": "Funktionen",
-                "Download videos as MP4 in various qualities": 
-                    "Videos als MP4 in verschiedenen Qualitäten herunterladen",
-                "Extract audio as MP3 with different bitrates": 
-                    "Audio als MP3 mit verschiedenen Bitraten extrahieren",
-                "Batch download from multiple URLs": 
-                    "Mehrere URLs gleichzeitig herunterladen",
-                "Progress tracking": "Fortschrittsverfolgung",
-                "Automatic FFmpeg integration": "Automatische FFmpeg-Integration",
-                "Author": "Autor",
-                "License": "Lizenz",
-                "Checking FFmpeg...": "Prüfe FFmpeg...",
-                "Downloading FFmpeg...": "Lade FFmpeg herunter...",
-                "FFmpeg ready": "FFmpeg bereit",
-                "FFmpeg missing": "FFmpeg fehlt",
-                "FFmpeg is required for audio conversion and video merging.": 
-                    "FFmpeg wird für Audio-Konvertierung und Video-Merging benötigt.",
-                "Please install FFmpeg or restart the application to attempt automatic download.": 
-                    "Bitte installieren Sie FFmpeg oder starten Sie die Anwendung neu für einen automatischen Download-Versuch.",
-                "Failed to download FFmpeg. Please install it manually.": 
-                    "FFmpeg konnte nicht heruntergeladen werden. Bitte manuell installieren."
-            }
-            
-            class GermanTranslator(QTranslator):
-                def translate(self, context, source, disambiguation=None, n=-1):
-                    return translations.get(source, source)
-            
-            self.translator = GermanTranslator()
-            QApplication.instance().installTranslator(self.translator)
-        
-        self.retranslate_ui()
-
-    def retranslate_ui(self):
-        """Update all UI elements with current translation"""
-        # Main window title
-        self.setWindowTitle(self.tr("Media Downloader Pro"))
-        
-        # URL group
-        self.url_group.setTitle(self.tr("Enter Video/Audio URLs"))
-        
-        # Options group
-        self.format_group.setTitle(self.tr("Download Options"))
-        self.quality_label.setText(self.tr("Quality:"))
-        self.folder_label.setText(self.tr("Save location: %s") % self.download_folder)
-        self.folder_btn.setText(self.tr("Change folder"))
-        
-        # Progress group
-        self.progress_group.setTitle(self.tr("Progress"))
-        self.status_label.setText(self.tr("Ready to start"))
-        
-        # Log
-        self.log_checkbox.setText(self.tr("Show log"))
-        self.log_group.setTitle(self.tr("Activity Log"))
-        
-        # Buttons
-        self.download_btn.setText(self.tr("Download Now"))
-        self.cancel_btn.setText(self.tr("Cancel"))
-        self.exit_btn.setText(self.tr("Exit"))
-        
-        # Menu items
-        self.file_menu.setTitle(self.tr("File"))
-        self.language_menu.setTitle(self.tr("Language"))
-        self.help_menu.setTitle(self.tr("Help"))
-        self.about_action.setText(self.tr("About"))
-        self.exit_action.setText(self.tr("Exit"))
-        
-        # Theme button
-        self.update_theme_button_text()
-
-        # Update FFmpeg status text without changing status
-        current_text = self.ffmpeg_status_label.text()
-        self.ffmpeg_status_label.setText(self.tr(current_text))
-
-    def init_ui(self):
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(15, 15, 15, 15)
-        main_layout.setSpacing(10)
-
-        self.create_menu_bar()
-
-        # Header with FFmpeg status, title and theme toggle
-        header_layout = QHBoxLayout()
-        
-        # FFmpeg status
-        ffmpeg_layout = QHBoxLayout()
-        ffmpeg_layout.setAlignment(Qt.AlignLeft)
-        self.ffmpeg_status_label = QLabel("Checking FFmpeg...")
-        self.ffmpeg_status_label.setFont(QFont("Arial", 9))
-        ffmpeg_layout.addWidget(self.ffmpeg_status_label)
-        header_layout.addLayout(ffmpeg_layout)
-        
-        # Title
-        self.header = QLabel("Media Downloader Pro")
-        self.header.setFont(QFont("Arial", 16, QFont.Bold))
-        self.header.setAlignment(Qt.AlignCenter)
-        header_layout.addWidget(self.header, stretch=1)
-        
-        # Theme toggle
-        self.theme_btn = QPushButton()
-        self.theme_btn.setFixedSize(100, 30)
-        self.update_theme_button_text()
-        self.theme_btn.setToolTip(self.tr("Toggle light/dark mode"))
-        self.theme_btn.clicked.connect(self.toggle_theme)
-        header_layout.addWidget(self.theme_btn)
-        
-        main_layout.addLayout(header_layout)
-
-        # URL input
-        self.url_group = QGroupBox()
-        url_layout = QVBoxLayout()
-        self.url_edit = QTextEdit()
-        self.url_edit.setPlaceholderText(self.tr("Paste one URL per line..."))
-        self.url_edit.setFont(QFont("Arial", 10))
-        url_layout.addWidget(self.url_edit)
-        self.url_group.setLayout(url_layout)
-        main_layout.addWidget(self.url_group)
-
-        # Format selection
-        self.format_group = QGroupBox()
-        format_layout = QVBoxLayout()
-        
-        self.format_combo = QComboBox()
-        formats = [
-            (self.tr("MP3 (192 kbps)"), "mp3_192"),
-            (self.tr("MP3 (320 kbps)"), "mp3_320"),
-            (self.tr("MP4 (720p)"), "mp4_720"),
-            (self.tr("MP4 (1080p)"), "mp4_1080"),
-            (self.tr("MP4 (Best quality)"), "mp4_best"),
-        ]
-        
-        for text, mode in formats:
-            self.format_combo.addItem(text, mode)
-
-        self.format_combo.setCurrentIndex(0)
-        
-        self.quality_label = QLabel()
-        format_layout.addWidget(self.quality_label)
-        format_layout.addWidget(self.format_combo)
-        
-        # Download location
-        folder_layout = QHBoxLayout()
-        self.folder_label = QLabel()
-        self.folder_label.setFont(QFont("Arial", 9))
-        folder_layout.addWidget(self.folder_label)
-        
-        self.folder_btn = QPushButton()
-        self.folder_btn.clicked.connect(self.select_download_folder)
-        folder_layout.addWidget(self.folder_btn)
-        format_layout.addLayout(folder_layout)
-        
-        self.format_group.setLayout(format_layout)
-        main_layout.addWidget(self.format_group)
-
-        # Progress display
-        self.progress_group = QGroupBox()
-        progress_layout = QVBoxLayout()
-        
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setAlignment(Qt.AlignCenter)
-        self.progress_bar.setFont(QFont("Arial", 9))
-        progress_layout.addWidget(self.progress_bar)
-        
-        self.status_label = QLabel()
-        self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setFont(QFont("Arial", 10, QFont.Bold))
-        progress_layout.addWidget(self.status_label)
-        
-        self.progress_group.setLayout(progress_layout)
-        main_layout.addWidget(self.progress_group)
-
-        # Log output (optional)
-        self.log_checkbox = QCheckBox()
-        self.log_checkbox.setChecked(False)
-        self.log_checkbox.stateChanged.connect(self.toggle_log)
-        main_layout.addWidget(self.log_checkbox)
-        
-        self.log_group = QGroupBox()
-        self.log_group.setVisible(False)
-        log_layout = QVBoxLayout()
-        self.log_output = QTextEdit()
-        self.log_output.setReadOnly(True)
-        self.log_output.setFont(QFont("Consolas", 9))
-        self.log_output.setWordWrapMode(QTextOption.NoWrap)
-        log_layout.addWidget(self.log_output)
-        self.log_group.setLayout(log_layout)
-        main_layout.addWidget(self.log_group)
-
-        # Button bar
-        button_layout = QHBoxLayout()
-        
-        self.download_btn = QPushButton()
-        self.download_btn.setFont(QFont("Arial", 10, QFont.Bold))
-        self.download_btn.setIcon(QIcon.fromTheme("media-playback-start"))
-        self.download_btn.clicked.connect(self.start_download)
-        button_layout.addWidget(self.download_btn)
-        
-        button_layout.addStretch()
-        
-        self.cancel_btn = QPushButton()
-        self.cancel_btn.setFont(QFont("Arial", 10))
-        self.cancel_btn.setIcon(QIcon.fromTheme("process-stop"))
-        self.cancel_btn.clicked.connect(self.cancel_download)
-        self.cancel_btn.setEnabled(False)
-        button_layout.addWidget(self.cancel_btn)
-        
-        self.exit_btn = QPushButton()
-        self.exit_btn.setFont(QFont("Arial", 10))
-        self.exit_btn.setIcon(QIcon.fromTheme("application-exit"))
-        self.exit_btn.clicked.connect(self.close)
-        button_layout.addWidget(self.exit_btn)
-        
-        main_layout.addLayout(button_layout)
-
-        # Widget settings
-        self.setMinimumSize(700, 550)
-        self.url_edit.setMinimumHeight(80)
-        self.log_output.setMinimumHeight(120)
-        self.url_edit.setAcceptRichText(False)
-        self.url_edit.setLineWrapMode(QTextEdit.NoWrap)
-
-    def update_theme_button_text(self):
-        if self.dark_mode:
-            self.theme_btn.setText(self.tr("Light Mode"))
-            self.theme_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #555;
-                    color: white;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #666;
-                }
-            """)
-        else:
-            self.theme_btn.setText(self.tr("Dark Mode"))
-            self.theme_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #ddd;
-                    color: black;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #eee;
-                }
-            """)
-
-    def create_menu_bar(self):
-        menubar = self.menuBar()
-        
-        # File menu
-        self.file_menu = menubar.addMenu("File")
-        self.exit_action = self.file_menu.addAction("Exit", self.close)
-        
-        # Language menu
-        self.language_menu = menubar.addMenu("Language")
-        self.language_group = QActionGroup(self)
-        
-        english_action = self.language_menu.addAction("English")
-        english_action.setCheckable(True)
-        english_action.setChecked(True)
-        english_action.triggered.connect(lambda: self.load_language("en"))
-        self.language_group.addAction(english_action)
-        
-        german_action = self.language_menu.addAction("Deutsch")
-        german_action.setCheckable(True)
-        german_action.triggered.connect(lambda: self.load_language("de"))
-        self.language_group.addAction(german_action)
-        
-        # Help menu
-        self.help_menu = menubar.addMenu("Help")
-        self.about_action = self.help_menu.addAction("About", self.show_about)
-        self.license_action = self.help_menu.addAction(self.tr("License"), self.show_license)
-
-    def show_license(self):
-        license_dialog = LicenseDialog(self)
-        license_dialog.exec_()
-
-    def show_about(self):
-        about_dialog = AboutDialog(self)
-        about_dialog.exec_()
-
-    def apply_dark_theme(self):
-        dark_palette = QPalette()
-        
-        dark_palette.setColor(QPalette.Window, QColor(45, 45, 45))
-        dark_palette.setColor(QPalette.WindowText, Qt.white)
-        dark_palette.setColor(QPalette.Base, QColor(30, 30, 30))
-        dark_palette.setColor(QPalette.Text, Qt.white)
-        dark_palette.setColor(QPalette.Button, QColor(60, 60, 60))
-        dark_palette.setColor(QPalette.ButtonText, Qt.white)
-        dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.HighlightedText, Qt.white)
-        dark_palette.setColor(QPalette.Link, QColor(100, 150, 240))
-        
-        self.setPalette(dark_palette)
-        
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2d2d2d;
-            }
-            QGroupBox {
-                border: 1px solid #444;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 15px;
-                background-color: #1e1e1e;
-                color: white;
-            }
-            QGroupBox::title {
-                color: #ddd;
-            }
-            QTextEdit, QProgressBar, QComboBox {
-                background-color: #1e1e1e;
-                color: white;
-                border: 1px solid #444;
-            }
-            QLabel, QCheckBox {
-                color: white;
-            }
-            QPushButton {
-                background-color: #3a3a3a;
-                color: white;
-                border: 1px solid #555;
-                padding: 5px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-            }
-            QPushButton:disabled {
-                background-color: #2a2a2a;
-                color: #777;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3a3a3a;
-                color: white;
-            }
-            QMenuBar {
-                background-color: #3a3a3a;
-                color: white;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 5px 10px;
-            }
-            QMenuBar::item:selected {
-                background-color: #555;
-            }
-            QMenu {
-                background-color: #3a3a3a;
-                color: white;
-                border: 1px solid #555;
-            }
-            QMenu::item:selected {
-                background-color: #555;
-            }
-        """)
-
-    def apply_light_theme(self):
-        self.setPalette(QApplication.style().standardPalette())
-        
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 15px;
-                background-color: white;
-                color: black;
-            }
-            QTextEdit, QProgressBar, QComboBox {
-                background-color: white;
-                color: black;
-                border: 1px solid #ddd;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: 1px solid #45a049;
-                padding: 5px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #777;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-            }
-            QMenuBar {
-                background-color: #f0f0f0;
-            }
-            QMenu {
-                background-color: white;
-                border: 1px solid #ddd;
-            }
-        """)
-
-    def toggle_log(self, state):
-        self.show_log = state == Qt.Checked
-        self.log_group.setVisible(self.show_log)
-
-    def select_download_folder(self):
-        folder = QFileDialog.getExistingDirectory(
-            self, 
-            self.tr("Select download folder"), 
-            self.download_folder,
-            options=QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
-        )
-        if folder:
-            self.download_folder = folder
-            self.folder_label.setText(self.tr("Save location: %s") % folder)
-            self.log(self.tr("Download folder changed to: %s") % folder, QColor(0, 128, 0))
-
-    def log(self, message, color=None):
-        if not self.show_log:
-            return
-            
-        if color:
-            self.log_output.setTextColor(color)
-        self.log_output.append(message)
-        self.log_output.ensureCursorVisible()
-        if color:
-            self.log_output.setTextColor(Qt.black if not self.dark_mode else Qt.white)
-
-    def start_download(self):
-        if self.ffmpeg_manager.install_status != "installed":
-            QMessageBox.critical(self, self.tr("Error"), self.tr("FFmpeg is not ready. Please wait or install manually."))
-            return
-
-        urls = self.url_edit.toPlainText().strip().split("\n")
-        urls = [url.strip() for url in urls if url.strip()]
-
-        if not urls:
-            QMessageBox.critical(self, self.tr("Error"), self.tr("No URLs entered!"))
-            return
-
-        if not os.path.exists(self.download_folder):
-            try:
-                os.makedirs(self.download_folder)
-            except OSError as e:
-                QMessageBox.critical(self, self.tr("Error"), self.tr("Could not create folder: %s") % str(e))
-                return
-
-        format_type = self.format_combo.currentData()
-        self.download_thread = DownloadThread(
-            urls, 
-            self.download_folder, 
-            format_type,
-            self.ffmpeg_manager.ffmpeg_path
-        )
-        self.download_thread.update_progress.connect(self.update_progress)
-        self.download_thread.finished.connect(self.download_finished)
-        
-        self.download_btn.setEnabled(False)
-        self.cancel_btn.setEnabled(True)
-        self.exit_btn.setEnabled(False)
-        self.download_thread.start()
-
-    def update_progress(self, percent, message):
-        self.progress_bar.setValue(percent)
-        self.status_label.setText(message)
-        if message and self.show_log:
-            if "✔" in message:
-                self.log(message, QColor(0, 200, 0))
-            elif "❌" in message:
-                self.log(message, QColor(255, 0, 0))
-            else:
-                self.log(message)
-
-    def download_finished(self):
-        self.download_btn.setEnabled(True)
-        self.cancel_btn.setEnabled(False)
-        self.exit_btn.setEnabled(True)
-        self.status_label.setText(self.tr("Download completed"))
-        self.download_thread = None
-
-    def cancel_download(self):
-        if self.download_thread:
-            self.download_thread.stop()
-            self.download_thread.wait()
-            self.log(self.tr("Download cancelled"), QColor(255, 165, 0))
-            self.download_finished()
-
-    def closeEvent(self, event):
-        if self.download_thread and self.download_thread.isRunning():
-            reply = QMessageBox.question(
-                self, self.tr("Download in progress"),
-                self.tr("A download is still active. Really quit?"),
-                QMessageBox.Yes | QMessageBox.No
-            )
-            if reply == QMessageBox.No:
-                event.ignore()
-                return
-            else:
-                self.cancel_download()
-        event.accept()
-
-    def tr(self, text):
-        return QApplication.translate("YouTubeDownloaderApp", text)
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    
-    locale = QLocale("en")
-    QLocale.setDefault(locale)
-    
-    window = YouTubeDownloaderApp()
-    window.show()
+"""
+Media Downloader Pro - Main Application File
+Optimized for fast startup with background FFmpeg check
+"""
+
+import sys
+import os
+import re
+import glob
+import functools
+import platform
+import time
+import queue
+import subprocess
+import urllib.request
+import zipfile
+import mmap
+import json
+import types
+import io
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import shutil
+import threading
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QPlainTextEdit, QPushButton, QProgressBar,
+    QFileDialog, QMessageBox, QGroupBox,
+    QComboBox, QCheckBox, QAction, QActionGroup, QDialog
+)
+from PyQt5.QtCore import (
+    Qt, QObject, QThread, QThreadPool, QRunnable, pyqtSignal, QTranslator,
+    QLocale, QTimer, QElapsedTimer
+)
+from PyQt5.QtGui import QFont, QIcon, QTextOption, QColor, QPalette, QTextCharFormat, QTextCursor
+
+# German UI strings, keyed by the English source text. Kept at module scope
+# so switching languages doesn't rebuild the mapping and translator class,
+# and wrapped read-only so nothing can mutate it behind the translator.
+_DE_TRANSLATIONS = {
+    "Media Downloader Pro": "Media Downloader Pro",
+    "Enter Video/Audio URLs": "Video/Audio URLs eingeben",
+    "Paste one URL per line...": "Eine URL pro Zeile einfügen...",
+    "Download Options": "Download-Optionen",
+    "Quality:": "Qualität:",
+    "Save location: %s": "Speicherort: %s",
+    "Change folder": "Ordner ändern",
+    "Progress": "Fortschritt",
+    "Ready to start": "Bereit zum Starten",
+    "Show log": "Log anzeigen",
+    "Activity Log": "Aktivitätsprotokoll",
+    "Download Now": "Download starten",
+    "Cancel": "Abbrechen",
+    "Exit": "Beenden",
+    "File": "Datei",
+    "Language": "Sprache",
+    "Help": "Hilfe",
+    "About": "Über",
+    "Error": "Fehler",
+    "No URLs entered!": "Keine URLs eingegeben!",
+    "Download completed": "Download abgeschlossen",
+    "Download cancelled": "Download abgebrochen",
+    "A download is still active. Really quit?": "Ein Download ist noch aktiv. Wirklich beenden?",
+    "Download in progress": "Download läuft",
+    "Processing: %s": "Verarbeite: %s",
+    "Downloading: %s": "Download: %s",
+    "Finished: %s": "Fertig: %s",
+    "Error with: %s": "Fehler bei: %s",
+    "Error: %s": "Fehler: %s",
+    "Could not create folder: %s": "Ordner konnte nicht erstellt werden: %s",
+    "yt-dlp is not installed!": "yt-dlp ist nicht installiert!",
+    "Toggle light/dark mode": "Hell/Dunkel Modus wechseln",
+    "About Media Downloader Pro": "Über Media Downloader Pro",
+    "A tool for downloading videos and audio from various platforms": 
+        "Ein Tool zum Herunterladen von Videos und Audio von verschiedenen Plattformen",
+    "Features": "Funktionen",
+    "Download videos as MP4 in various qualities": 
+        "Videos als MP4 in verschiedenen Qualitäten herunterladen",
+    "Extract audio as MP3 with different bitrates": 
+        "Audio als MP3 mit verschiedenen Bitraten extrahieren",
+    "Batch download from multiple URLs": 
+        "Mehrere URLs gleichzeitig herunterladen",
+    "Progress tracking": "Fortschrittsverfolgung",
+    "Automatic FFmpeg integration": "Automatische FFmpeg-Integration",
+    "Author": "Autor",
+    "License": "Lizenz",
+    "Checking FFmpeg...": "Prüfe FFmpeg...",
+    "Downloading FFmpeg...": "Lade FFmpeg herunter...",
+    "FFmpeg ready": "FFmpeg bereit",
+    "FFmpeg missing": "FFmpeg fehlt",
+    "FFmpeg is required for audio conversion and video merging.": 
+        "FFmpeg wird für Audio-Konvertierung und Video-Merging benötigt.",
+    "Please install FFmpeg or restart the application to attempt automatic download.": 
+        "Bitte installieren Sie FFmpeg oder starten Sie die Anwendung neu für einen automatischen Download-Versuch.",
+    "Failed to download FFmpeg. Please install it manually.":
+        "FFmpeg konnte nicht heruntergeladen werden. Bitte manuell installieren."
+}
+# Interned so the dict.get in _GermanTranslator.translate can short-circuit
+# on pointer equality: retranslate_ui passes compile-time-interned literals.
+_DE_TRANSLATIONS = types.MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _DE_TRANSLATIONS.items()})
+
+def _load_qss(name, fallback):
+    """Read a stylesheet from resources/ once at import.
+
+    The embedded fallback covers bundles (e.g. PyInstaller one-file) where
+    the .qss data files weren't shipped alongside the module.
+    """
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "resources", name)
+    if not os.path.exists(path) and hasattr(sys, '_MEIPASS'):
+        path = os.path.join(sys._MEIPASS, "resources", name)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return fallback
+
+# Theme stylesheets. Loaded once at import (editable without touching the
+# code); a theme toggle hands Qt the same pre-built string every time.
+_DARK_QSS_FALLBACK = """
+    QMainWindow {
+        background-color: #2d2d2d;
+    }
+    QGroupBox, QTextEdit, QPlainTextEdit, QProgressBar, QComboBox {
+        background-color: #1e1e1e;
+        color: white;
+        border: 1px solid #444;
+    }
+    QGroupBox {
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 15px;
+    }
+    QGroupBox::title {
+        color: #ddd;
+    }
+    QLabel, QCheckBox {
+        color: white;
+    }
+    QPushButton {
+        background-color: #3a3a3a;
+        color: white;
+        border: 1px solid #555;
+        padding: 5px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #4a4a4a;
+    }
+    QPushButton:disabled {
+        background-color: #2a2a2a;
+        color: #777;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+    }
+    QMenuBar, QMenu, QComboBox QAbstractItemView {
+        background-color: #3a3a3a;
+        color: white;
+    }
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 5px 10px;
+    }
+    QMenu {
+        border: 1px solid #555;
+    }
+    QMenuBar::item:selected, QMenu::item:selected {
+        background-color: #555;
+    }
+"""
+
+_LIGHT_QSS_FALLBACK = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QGroupBox, QTextEdit, QPlainTextEdit, QProgressBar, QComboBox, QMenu {
+        background-color: white;
+        color: black;
+        border: 1px solid #ddd;
+    }
+    QGroupBox {
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 15px;
+    }
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: 1px solid #45a049;
+        padding: 5px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #777;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+    }
+    QMenuBar {
+        background-color: #f0f0f0;
+    }
+"""
+
+_DARK_QSS = _load_qss("dark.qss", _DARK_QSS_FALLBACK)
+_LIGHT_QSS = _load_qss("light.qss", _LIGHT_QSS_FALLBACK)
+
+# Dialog and theme-button stylesheets, hoisted out of the apply_theme /
+# update_theme_button_text bodies so toggling the theme hands Qt the same
+# pre-built strings instead of fresh literals.
+_DARK_DIALOG_QSS = """
+    QDialog {
+        background-color: #2d2d2d;
+    }
+    QPlainTextEdit {
+        color: #f0f0f0;
+        background-color: #252525;
+        border: 1px solid #444;
+    }
+    QPushButton {
+        background-color: #555;
+        color: white;
+        border: 1px solid #666;
+        padding: 5px;
+        border-radius: 4px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #666;
+    }
+"""
+
+_LIGHT_DIALOG_QSS = """
+    QDialog {
+        background-color: #ffffff;
+    }
+    QPlainTextEdit {
+        color: #333333;
+        background-color: #f9f9f9;
+        border: 1px solid #ddd;
+    }
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: 1px solid #45a049;
+        padding: 5px;
+        border-radius: 4px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+
+_DARK_ABOUT_QSS = """
+    QMessageBox {
+        background-color: #2d2d2d;
+    }
+    QLabel {
+        color: white;
+    }
+    QPushButton {
+        min-width: 120px;
+    }
+"""
+
+_LIGHT_ABOUT_QSS = """
+    QMessageBox {
+        background-color: white;
+    }
+    QLabel {
+        color: black;
+    }
+    QPushButton {
+        min-width: 120px;
+    }
+"""
+
+_DARK_THEME_BTN_QSS = """
+    QPushButton {
+        background-color: #555;
+        color: white;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #666;
+    }
+"""
+
+_LIGHT_THEME_BTN_QSS = """
+    QPushButton {
+        background-color: #ddd;
+        color: black;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #eee;
+    }
+"""
+
+# Shared fonts. Each QFont() construction goes through font matching, so the
+# handful of fonts the UI uses are built once here.
+_FONT_SMALL = QFont("Arial", 9)
+_FONT_BODY = QFont("Arial", 10)
+_FONT_BODY_BOLD = QFont("Arial", 10, QFont.Bold)
+_FONT_HEADER = QFont("Arial", 16, QFont.Bold)
+_FONT_MONO = QFont("Consolas", 9)
+_FONT_MONO_LARGE = QFont("Consolas", 10)
+
+# Status colors shared by the log and the FFmpeg indicator, built once
+# instead of per message.
+_COL_OK = QColor(0, 200, 0)
+_COL_ERR = QColor(255, 0, 0)
+_COL_WARN = QColor(255, 165, 0)
+_COL_INFO = QColor(0, 128, 0)
+_COL_PENDING = QColor(200, 200, 0)
+_COL_BUSY = QColor(0, 0, 200)
+_COL_NEUTRAL = QColor(255, 255, 255)
+_COL_TEXT_LIGHT = QColor(Qt.black)
+_COL_TEXT_DARK = QColor(Qt.white)
+
+# Status codes carried with update_progress emissions so the receiver
+# doesn't have to sniff the message text for markers.
+STATUS_INFO, STATUS_OK, STATUS_ERR = 0, 1, 2
+_STATUS_COLORS = {STATUS_OK: _COL_OK, STATUS_ERR: _COL_ERR}
+
+# Prebuilt one-rule stylesheets for the FFmpeg status label, keyed by color.
+# The label needs a per-widget stylesheet (the app-level QLabel color rule
+# overrides palette writes); building them once avoids the f-string per
+# status transition.
+_STATUS_LABEL_QSS = {
+    c.rgb(): f"color: {c.name()};"
+    for c in (_COL_NEUTRAL, _COL_PENDING, _COL_BUSY, _COL_OK, _COL_ERR)
+}
+
+# Language menu entries: (label, locale code, checked by default).
+_LANGS = (
+    ("English", "en", True),
+    ("Deutsch", "de", False),
+)
+
+# Dark-mode palette, built once at import so toggling the theme reassigns
+# the same instance instead of reconstructing nine QColor entries.
+_DARK_PALETTE = QPalette()
+_DARK_PALETTE.setColor(QPalette.Window, QColor(45, 45, 45))
+_DARK_PALETTE.setColor(QPalette.WindowText, Qt.white)
+_DARK_PALETTE.setColor(QPalette.Base, QColor(30, 30, 30))
+_DARK_PALETTE.setColor(QPalette.Text, Qt.white)
+_DARK_PALETTE.setColor(QPalette.Button, QColor(60, 60, 60))
+_DARK_PALETTE.setColor(QPalette.ButtonText, Qt.white)
+_DARK_PALETTE.setColor(QPalette.Highlight, QColor(42, 130, 218))
+_DARK_PALETTE.setColor(QPalette.HighlightedText, Qt.white)
+_DARK_PALETTE.setColor(QPalette.Link, QColor(100, 150, 240))
+
+@functools.lru_cache(maxsize=256)
+def _tr(text):
+    """Memoized QApplication.translate for the main window's string set.
+
+    The cache is cleared on language switches (see load_language).
+    """
+    return QApplication.translate("YouTubeDownloaderApp", text)
+
+# URLs contain no whitespace, so one C-level scan pulls them out of the
+# pasted text without per-line strip() passes.
+_URL_SPLIT = re.compile(r'\S+')
+
+@functools.lru_cache(maxsize=1)
+def _load_license_text():
+    """Read LICENSE.txt once; the file never changes at runtime."""
+    try:
+        base_path = os.path.dirname(sys.argv[0])
+        license_path = os.path.join(base_path, "LICENSE.txt")
+
+        if not os.path.exists(license_path) and hasattr(sys, '_MEIPASS'):
+            license_path = os.path.join(sys._MEIPASS, "LICENSE.txt")
+
+        if os.path.exists(license_path):
+            with open(license_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm[:].decode('utf-8')
+        return "License file not found at: " + license_path
+    except Exception as e:
+        return f"Error loading license: {str(e)}"
+
+class _CountingReader(io.RawIOBase):
+    """Wrap a response so shutil.copyfileobj can stream it while a callback
+    observes the running byte count."""
+
+    def __init__(self, src, callback):
+        self._src = src
+        self._callback = callback
+        self._count = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        n = self._src.readinto(b)
+        if n:
+            self._count += n
+            self._callback(self._count)
+        return n
+
+def _extract_zip_parallel(archive_path, extract_dir):
+    """Extract a ZIP archive using one worker per core.
+
+    DEFLATE decompression releases the GIL inside zlib, so extraction
+    scales with cores. ZipFile handles aren't thread-safe, so every worker
+    opens its own handle and the directory tree is created up front.
+    """
+    with zipfile.ZipFile(archive_path) as zf:
+        infos = zf.infolist()
+
+    files = []
+    for info in infos:
+        target = os.path.join(extract_dir, info.filename)
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(target) or extract_dir, exist_ok=True)
+            files.append(info)
+
+    workers = max(1, min(os.cpu_count() or 1, len(files)))
+
+    def extract_slice(slice_infos):
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in slice_infos:
+                zf.extract(info, extract_dir)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(extract_slice, files[i::workers])
+                   for i in range(workers)]
+        for future in futures:
+            future.result()
+
+def _theme_icon(name, _cache={}):
+    """Resolve a theme icon once; QIcon.fromTheme hits the icon database."""
+    icon = _cache.get(name)
+    if icon is None:
+        icon = _cache[name] = QIcon.fromTheme(name)
+    return icon
+
+def _window_icon(_cache=[]):
+    """Resolve and cache the application window icon."""
+    if not _cache:
+        path = os.path.join(os.path.dirname(__file__), "resources", "logo.ico")
+        _cache.append(QIcon(path) if os.path.exists(path) else QIcon())
+    return _cache[0]
+
+def _mp3_opts(quality):
+    return {
+        'format': 'bestaudio/best',
+        'postprocessors': [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': 'mp3',
+            'preferredquality': quality,
+        }],
+        # Let ffmpeg use all cores for the encode; sources that are already
+        # MP3 are stream-copied by yt-dlp and skip it entirely.
+        'postprocessor_args': {'extractaudio': ['-threads', '0']},
+        'keepvideo': False,
+    }
+
+def _mp4_opts(height):
+    selector = 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best'
+    if height:
+        selector = (f'bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]'
+                    f'/best[height<={height}][ext=mp4]/best')
+    return {'format': selector, 'merge_output_format': 'mp4'}
+
+# Per-format yt-dlp option fragments keyed by the combo box format codes.
+# Built once at import so option assembly is a single dict lookup.
+_FORMAT_OPTS = {
+    'mp3_192': _mp3_opts('192'),
+    'mp3_320': _mp3_opts('320'),
+    'mp4_720': _mp4_opts('720'),
+    'mp4_1080': _mp4_opts('1080'),
+    'mp4_best': _mp4_opts(None),
+}
+
+class _GermanTranslator(QTranslator):
+    __slots__ = ()
+
+    def translate(self, context, source, disambiguation=None, n=-1):
+        return _DE_TRANSLATIONS.get(source, source)
+
+class FFmpegSignals(QObject):
+    """Signal container for FFmpegManager (QRunnable can't own signals)."""
+    status_changed = pyqtSignal(str, str)  # status, message
+
+
+class FFmpegManager(QRunnable):
+    """Handles FFmpeg installation and verification in background.
+
+    Runs as a one-shot job on the global thread pool; a dedicated QThread
+    (with its own OS thread and event loop) is overkill for a check that
+    usually finishes in milliseconds.
+    """
+
+    _config_file = os.path.join(
+        os.path.expanduser("~"), ".config", "media-downloader-pro",
+        "ffmpeg.json")
+
+    def __init__(self, parent=None):
+        super().__init__()
+        # The app keeps reading install_status/ffmpeg_path after run()
+        # returns, so don't let the pool delete us.
+        self.setAutoDelete(False)
+        self.signals = FFmpegSignals(parent)
+        self.status_changed = self.signals.status_changed
+        self.ffmpeg_path = None
+        self.install_status = "checking"
+        self.platform = platform.system().lower()
+        self.parent = parent
+
+    def run(self):
+        """Run in background thread"""
+        self.find_ffmpeg()
+
+    @classmethod
+    def _load_cached_path(cls):
+        """Return the cached ffmpeg path if it still looks valid.
+
+        shutil.which walks every PATH directory and the common-paths scan
+        stats up to 6 more candidates; a hit here costs a single stat. The
+        cache is invalidated when the binary moved or its mtime changed.
+        """
+        try:
+            with open(cls._config_file, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            path = cached.get("ffmpeg")
+            if path and os.path.exists(path) and \
+                    os.path.getmtime(path) == cached.get("mtime"):
+                return path
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @classmethod
+    def _save_cached_path(cls, path):
+        """Persist the discovered ffmpeg path for the next startup."""
+        try:
+            os.makedirs(os.path.dirname(cls._config_file), exist_ok=True)
+            with open(cls._config_file, "w", encoding="utf-8") as f:
+                json.dump({"ffmpeg": path,
+                           "mtime": os.path.getmtime(path)}, f)
+        except OSError:
+            pass
+
+    def find_ffmpeg(self):
+        """Try to find FFmpeg in system PATH or common locations"""
+        try:
+            # Cached result from a previous launch: one stat instead of a
+            # full PATH traversal plus the common-paths probes.
+            cached = self._load_cached_path()
+            if cached:
+                self.ffmpeg_path = cached
+                self.install_status = "installed"
+                self.status_changed.emit("installed", "FFmpeg ready")
+                return True
+
+            # First quick check if ffmpeg is in PATH
+            ffmpeg_path = shutil.which("ffmpeg")
+            if ffmpeg_path:
+                self.ffmpeg_path = ffmpeg_path
+                self.install_status = "installed"
+                self._save_cached_path(ffmpeg_path)
+                self.status_changed.emit("installed", "FFmpeg ready")
+                return True
+            
+            # More thorough check in background
+            if self.platform == "windows":
+                common_paths = [
+                    os.path.join(os.environ.get("ProgramFiles", ""), "FFmpeg", "bin", "ffmpeg.exe"),
+                    os.path.join(os.environ.get("ProgramFiles(x86)", ""), "FFmpeg", "bin", "ffmpeg.exe"),
+                    os.path.join(os.getcwd(), "ffmpeg", "bin", "ffmpeg.exe")
+                ]
+            else:  # Linux/Mac
+                common_paths = [
+                    "/usr/local/bin/ffmpeg",
+                    "/usr/bin/ffmpeg",
+                    os.path.join(os.path.expanduser("~"), "bin", "ffmpeg")
+                ]
+            
+            for path in common_paths:
+                if os.path.exists(path):
+                    self.ffmpeg_path = path
+                    self.install_status = "installed"
+                    self._save_cached_path(path)
+                    self.status_changed.emit("installed", "FFmpeg ready")
+                    return True
+            
+            # If not found, attempt download (Windows only)
+            if self.platform == "windows":
+                self.status_changed.emit("downloading", "Downloading FFmpeg...")
+                if self.download_ffmpeg():
+                    self.status_changed.emit("installed", "FFmpeg ready")
+                    return True
+            
+            self.install_status = "missing"
+            self.status_changed.emit("missing", "FFmpeg missing")
+            return False
+            
+        except Exception as e:
+            print(f"Error finding FFmpeg: {e}")
+            self.install_status = "missing"
+            self.status_changed.emit("missing", "FFmpeg check failed")
+            return False
+    
+    def download_ffmpeg(self):
+        """Download FFmpeg for Windows"""
+        try:
+            url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+            temp_dir = tempfile.mkdtemp()
+            archive_path = os.path.join(temp_dir, "ffmpeg.zip")
+            
+            # Stream the archive through copyfileobj's C-level copy loop
+            # with a 1 MB buffer; urlretrieve reads in 8 KB blocks and fires
+            # its callback per block. Progress is only emitted when the
+            # integer percent changes to keep the Qt event queue quiet.
+            with urllib.request.urlopen(url) as resp:
+                total = int(resp.headers.get('Content-Length', 0))
+                last_pct = -1
+
+                def report(downloaded):
+                    nonlocal last_pct
+                    if total:
+                        pct = min(downloaded * 100 // total, 100)
+                        if pct != last_pct:
+                            last_pct = pct
+                            self.status_changed.emit(
+                                "downloading", f"Downloading FFmpeg... {pct}%")
+
+                with open(archive_path, 'wb') as f:
+                    # Preallocate the known size up front: one extent/metadata
+                    # transaction instead of one per append, and less
+                    # fragmentation for the sustained write that follows.
+                    if total:
+                        try:
+                            if hasattr(os, 'posix_fallocate'):
+                                os.posix_fallocate(f.fileno(), 0, total)
+                            else:
+                                f.truncate(total)
+                        except OSError:
+                            pass
+                    shutil.copyfileobj(
+                        _CountingReader(resp, report), f, 1 << 20)
+            
+            # Extract
+            extract_dir = os.path.join(os.getcwd(), "ffmpeg")
+            os.makedirs(extract_dir, exist_ok=True)
+            
+            _extract_zip_parallel(archive_path, extract_dir)
+            
+            # Find the binary. The release layout is deterministic
+            # (ffmpeg-*/bin/ffmpeg.exe), so a direct glob avoids statting
+            # every extracted file; keep os.walk as a fallback in case the
+            # archive layout ever changes.
+            matches = glob.glob(
+                os.path.join(extract_dir, "ffmpeg-*", "bin", "ffmpeg.exe"))
+            if not matches:
+                for root, dirs, files in os.walk(extract_dir):
+                    if "ffmpeg.exe" in files:
+                        matches = [os.path.join(root, "ffmpeg.exe")]
+                        break
+
+            if matches:
+                self.ffmpeg_path = matches[0]
+                self.install_status = "installed"
+                self._save_cached_path(self.ffmpeg_path)
+
+                # Add to PATH for this session
+                os.environ["PATH"] = os.path.dirname(self.ffmpeg_path) + os.pathsep + os.environ.get("PATH", "")
+
+                shutil.rmtree(temp_dir)
+                return True
+
+            return False
+                
+        except Exception as e:
+            print(f"Error downloading FFmpeg: {e}")
+            return False
+
+class DownloadThread(QThread):
+    """
+    A QThread subclass that handles the actual downloading process in the background.
+    """
+    update_progress = pyqtSignal(int, str, int)
+    finished = pyqtSignal()
+
+    def __init__(self, urls, download_folder, format_type, ffmpeg_path):
+        super().__init__()
+        self.urls = urls
+        self.download_folder = download_folder
+        self.format_type = format_type
+        self.ffmpeg_path = ffmpeg_path
+        self.is_running = True
+        self._last_emit = 0.0
+        self._last_pct = -1
+        # Translate the message templates once; tr() walks the translator
+        # chain and the hook fires far too often to pay that per call. A
+        # language switch mid-download would go stale, but running downloads
+        # aren't re-translated anyway.
+        self._t_downloading = self.tr("Downloading: %s")
+        self._t_finished = self.tr("Finished: %s")
+        self._t_error = self.tr("Error: %s")
+        # The options only depend on constructor arguments, so build them once.
+        self.ydl_opts = self.build_ytdlp_options()
+
+    def run(self):
+        # The batch is network-bound, so URLs download concurrently on a
+        # small thread pool (yt-dlp is synchronous and releases the GIL
+        # during socket I/O). Signal emissions from the workers are queued
+        # across the thread boundary by Qt as usual.
+        try:
+            import yt_dlp
+            url_queue = queue.Queue()
+            for url in self.urls:
+                url_queue.put(url)
+            workers = self._max_workers()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(self._worker, url_queue)
+                           for _ in range(workers)]
+                for future in as_completed(futures):
+                    exc = future.exception()
+                    if exc is not None and not isinstance(
+                            exc, yt_dlp.utils.DownloadCancelled):
+                        self.update_progress.emit(
+                            0, f"❌ {self._t_error % str(exc)}", STATUS_ERR)
+        except ImportError:
+            self.update_progress.emit(
+                0, f"❌ {self.tr('yt-dlp is not installed!')}", STATUS_ERR)
+        except Exception as e:
+            self.update_progress.emit(0, f"❌ {self._t_error % str(e)}", STATUS_ERR)
+        finally:
+            # Always emitted - the UI re-enables its buttons on this signal,
+            # so a crashed run must not leave them disabled.
+            self.finished.emit()
+
+    def _max_workers(self):
+        # Let Qt's idea of a sensible thread count size the pool, capped so
+        # large batches don't open dozens of simultaneous downloads.
+        return max(1, min(8, QThread.idealThreadCount(), len(self.urls)))
+
+    def _worker(self, url_queue):
+        import yt_dlp
+        # One YoutubeDL per worker (the instances aren't thread-safe), reused
+        # for every URL the worker pulls from the queue - keep-alive
+        # connections and extractor caches survive across items instead of
+        # being torn down per URL.
+        with yt_dlp.YoutubeDL(dict(self.ydl_opts)) as ydl:
+            while self.is_running:
+                try:
+                    url = url_queue.get_nowait()
+                except queue.Empty:
+                    return
+                ydl.download([url])
+
+    def progress_hook(self, d):
+        if not self.is_running:
+            # Cheap: yt_dlp is in sys.modules by the time any hook fires.
+            import yt_dlp
+            raise yt_dlp.utils.DownloadCancelled()
+
+        if d['status'] == 'downloading':
+            # Compute the percent from the byte counters; '_percent_str' is
+            # meant for display and can contain ANSI escapes.
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            downloaded = d.get('downloaded_bytes')
+            if not total or downloaded is None:
+                return
+            progress_int = min(int(downloaded * 100 // total), 100)
+            # yt-dlp fires this hook per fragment; emitting every time floods
+            # the Qt event queue and freezes the GUI. Only emit when the
+            # percent changes or at most ~10 times a second.
+            now = time.monotonic()
+            if progress_int == self._last_pct and now - self._last_emit < 0.1:
+                return
+            self._last_pct = progress_int
+            self._last_emit = now
+            self.update_progress.emit(
+                progress_int,
+                self._t_downloading % d.get('filename', ''),
+                STATUS_INFO
+            )
+        elif d['status'] == 'finished':
+            self.update_progress.emit(
+                100, f"✔ {self._t_finished % d.get('filename', '')}", STATUS_OK
+            )
+        elif d['status'] == 'error':
+            # With 'ignoreerrors' set, yt-dlp reports per-URL failures here
+            # instead of raising, so surface them the same way the old
+            # per-URL try/except did.
+            self.update_progress.emit(
+                0, f"❌ {self._t_error % d.get('filename', '')}", STATUS_ERR
+            )
+
+    def build_ytdlp_options(self):
+        opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'outtmpl': os.path.join(self.download_folder, '%(title)s.%(ext)s'),
+            'noplaylist': True,
+            'ignoreerrors': True,
+            'ffmpeg_location': self.ffmpeg_path if self.ffmpeg_path else None,
+            'progress_hooks': [self.progress_hook],
+            # Network tuning: an 8 MB write buffer keeps syscalls per MB low,
+            # 10 MB chunks stay below known CDN throttling thresholds, and
+            # the fragment parallelism scales with the machine.
+            'buffersize': 8 << 20,
+            'http_chunk_size': 10485760,
+            'concurrent_fragment_downloads': max(4, min(16, os.cpu_count() or 4)),
+            'socket_timeout': 20,
+            'http_headers': {'Connection': 'keep-alive'},
+            'retries': 3,
+            'fragment_retries': 5,
+            # Keep .part files and resume partial downloads after a cancel
+            # or crash instead of starting over.
+            'continuedl': True,
+        }
+
+        opts.update(_FORMAT_OPTS.get(self.format_type, {}))
+        return opts
+
+    def stop(self):
+        # Only request cancellation here - never block the calling (GUI)
+        # thread waiting for yt-dlp to tear down. The progress hook raises
+        # DownloadCancelled on the next event and finished fires as usual.
+        self.is_running = False
+        if self.isRunning():
+            self.requestInterruption()
+
+class LicenseDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(self.tr("GPL License"))
+        self.setMinimumSize(700, 500)
+        
+        # Hauptlayout
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+        
+        # Lizenztext - QPlainTextEdit scrolls natively and lays out long
+        # documents far cheaper than a word-wrapped QLabel in a scroll area.
+        self.license_view = QPlainTextEdit()
+        self.license_view.setReadOnly(True)
+        self.license_view.setLineWrapMode(QPlainTextEdit.WidgetWidth)
+        self.license_view.setFont(_FONT_MONO_LARGE)
+
+        # OK-Button
+        self.btn_ok = QPushButton("OK")
+        self.btn_ok.clicked.connect(self.accept)
+        self.btn_ok.setFixedWidth(100)
+
+        layout.addWidget(self.license_view)
+        layout.addWidget(self.btn_ok, alignment=Qt.AlignRight)
+        
+        self.load_license_text()
+        self.apply_theme(parent.dark_mode if parent else False)
+
+    def load_license_text(self):
+        self.license_view.setPlainText(_load_license_text())
+
+    def apply_theme(self, dark_mode):
+        self.setStyleSheet(_DARK_DIALOG_QSS if dark_mode else _LIGHT_DIALOG_QSS)
+
+class AboutDialog(QMessageBox):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(self.tr("About Media Downloader Pro"))
+        
+        about_text = f"""
+        <h2>Media Downloader Pro</h2>
+        <p>{self.tr('A tool for downloading videos and audio from various platforms')}</p>
+        
+        <h3>{self.tr('Features')}</h3>
+        <ul>
+            <li>{self.tr('Download videos as MP4 in various qualities')}</li>
+            <li>{self.tr('Extract audio as MP3 with different bitrates')}</li>
+            <li>{self.tr('Batch download from multiple URLs')}</li>
+            <li>{self.tr('Progress tracking')}</li>
+            <li>{self.tr('Automatic FFmpeg integration')}</li>
+        </ul>
+        
+        <p><b>{self.tr('Author')}:</b> Jörg Schröder</p>
+        <p><b>Website:</b> <a href="https://github.com/xGohac/Media-Downloader-Pro">Media-Downloader-Pro</a></p>
+        <p><b>{self.tr('License')}:</b> GNU General Public License v3.0</p>
+        """
+        
+        self.setText(about_text)
+        self.setIcon(QMessageBox.Information)
+        
+        self.addButton(self.tr("View Full License"), QMessageBox.ActionRole)
+        self.buttonClicked.connect(self.on_button_click)
+        
+        self.apply_theme(parent.dark_mode if parent else True)
+
+    def on_button_click(self, button):
+        if button.text() == self.tr("View Full License"):
+            license_dialog = LicenseDialog(self.parent())
+            license_dialog.exec_()
+
+    def apply_theme(self, dark_mode):
+        self.setStyleSheet(_DARK_ABOUT_QSS if dark_mode else _LIGHT_ABOUT_QSS)
+
+class YouTubeDownloaderApp(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.dark_mode = True
+        self.current_language = "en"
+        self.translator = QTranslator()
+        # standardPalette() builds a fresh palette copy inside Qt; grab it
+        # once so light-theme toggles just reassign it.
+        self._light_palette = QApplication.style().standardPalette()
+        
+        self.setWindowTitle("Media Downloader Pro")
+        self.setGeometry(100, 100, 800, 600)
+        self.download_folder = os.path.expanduser("~/Downloads")
+        self.download_thread = None
+        self.show_log = False
+        self._license_dialog = None
+        self._about_dialog = None
+        self._quit_box = None
+
+        # Coalesce progress repaints: skip unchanged percents and cap the
+        # status label at ~30 updates a second.
+        self._last_percent = -1
+        self._last_msg = ""
+        self._last_status_ms = 0
+        self._paint_timer = QElapsedTimer()
+        self._paint_timer.start()
+
+        # Log lines are buffered and flushed in batches; appending to the
+        # widget per progress event thrashes the text document.
+        self._log_buf = deque(maxlen=500)
+        self._log_formats = {}
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start(100)
+        
+        # Initialize FFmpeg manager
+        self.ffmpeg_manager = FFmpegManager(self)
+        self.ffmpeg_manager.status_changed.connect(self.update_ffmpeg_status)
+
+        # A valid cached path from a previous launch makes the whole check
+        # one stat; resolve it synchronously and skip the background job.
+        cached_ffmpeg = FFmpegManager._load_cached_path()
+        if cached_ffmpeg:
+            self.ffmpeg_manager.ffmpeg_path = cached_ffmpeg
+            self.ffmpeg_manager.install_status = "installed"
+        else:
+            # Run the check on a private single-thread pool, deferred past
+            # first paint. Never the global pool: Qt fans image conversions
+            # out to it, and this GIL-bound job parked there deadlocks
+            # startup on single-worker pools (and a slow FFmpeg download
+            # would starve Qt's own jobs for minutes).
+            self._ffmpeg_pool = QThreadPool(self)
+            self._ffmpeg_pool.setMaxThreadCount(1)
+            QTimer.singleShot(100, self._start_ffmpeg_check)
+
+        icon = _window_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
+
+
+        self.init_ui()
+        self.apply_dark_theme()
+        self.load_language(self.current_language)
+
+        # The status label exists only after init_ui, so the synchronous
+        # cached-path result is reported here.
+        if cached_ffmpeg:
+            self.update_ffmpeg_status("installed", "FFmpeg ready")
+
+    def _start_ffmpeg_check(self):
+        self._ffmpeg_pool.start(self.ffmpeg_manager)
+
+    def update_ffmpeg_status(self, status, message):
+        """Update UI based on FFmpeg status (called from background thread)"""
+        color = _COL_NEUTRAL
+        
+        if status == "checking":
+            color = _COL_PENDING
+        elif status == "downloading":
+            color = _COL_BUSY
+        elif status == "installed":
+            color = _COL_OK
+            self.download_btn.setEnabled(True)
+        elif status == "missing":
+            color = _COL_ERR
+            self.download_btn.setEnabled(False)
+            self.log(self.tr("FFmpeg is required for audio conversion and video merging."), _COL_WARN)
+        
+        self.ffmpeg_status_label.setText(message)
+        # A palette write won't do here: the app-level 'QLabel { color: ... }'
+        # theme rule takes precedence over palettes, so the per-label
+        # stylesheet override stays - but with prebuilt one-rule strings
+        # instead of per-transition f-string formatting.
+        self.ffmpeg_status_label.setStyleSheet(_STATUS_LABEL_QSS[color.rgb()])
+
+        if status == "missing" and "check failed" in message:
+            self.log(self.tr("FFmpeg check failed. Please install manually."), _COL_ERR)
+
+    def toggle_theme(self):
+        self.dark_mode = not self.dark_mode
+        if self.dark_mode:
+            self.apply_dark_theme()
+        else:
+            self.apply_light_theme()
+        self.update_theme_button_text()
+        self.update()
+
+    def load_language(self, lang_code):
+        self.current_language = lang_code
+        QApplication.instance().removeTranslator(self.translator)
+        _tr.cache_clear()
+        
+        if lang_code == "de":
+            self.translator = _GermanTranslator()
+            QApplication.instance().installTranslator(self.translator)
+
+        # The cached dialogs baked their strings in at construction; drop
+        # them so the next show rebuilds with the new translator.
+        self._license_dialog = None
+        self._about_dialog = None
+
+        self.retranslate_ui()
+
+    def retranslate_ui(self):
+        """Update all UI elements with current translation"""
+        # Main window title
+        self.setWindowTitle(self.tr("Media Downloader Pro"))
+        
+        # URL group
+        self.url_group.setTitle(self.tr("Enter Video/Audio URLs"))
+        
+        # Options group
+        self.format_group.setTitle(self.tr("Download Options"))
+        self.quality_label.setText(self.tr("Quality:"))
+        # Message templates that get re-formatted with new values later;
+        # translate them once per language switch.
+        self._fmt_save_loc = self.tr("Save location: %s")
+        self._fmt_folder_changed = self.tr("Download folder changed to: %s")
+        self._t_completed = self.tr("Download completed")
+        self._t_cancelled = self.tr("Download cancelled")
+        self.folder_label.setText(self._fmt_save_loc % self.download_folder)
+        self.folder_btn.setText(self.tr("Change folder"))
+        
+        # Progress group
+        self.progress_group.setTitle(self.tr("Progress"))
+        self.status_label.setText(self.tr("Ready to start"))
+        
+        # Log
+        self.log_checkbox.setText(self.tr("Show log"))
+        self.log_group.setTitle(self.tr("Activity Log"))
+        
+        # Buttons
+        self.download_btn.setText(self.tr("Download Now"))
+        self.cancel_btn.setText(self.tr("Cancel"))
+        self.exit_btn.setText(self.tr("Exit"))
+        
+        # Menu items
+        self.file_menu.setTitle(self.tr("File"))
+        self.language_menu.setTitle(self.tr("Language"))
+        self.help_menu.setTitle(self.tr("Help"))
+        self.about_action.setText(self.tr("About"))
+        self.exit_action.setText(self.tr("Exit"))
+        
+        # Theme button
+        self.update_theme_button_text()
+
+        # Update FFmpeg status text without changing status
+        current_text = self.ffmpeg_status_label.text()
+        self.ffmpeg_status_label.setText(self.tr(current_text))
+
+    def init_ui(self):
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(15, 15, 15, 15)
+        main_layout.setSpacing(10)
+
+        self.create_menu_bar()
+
+        # Header with FFmpeg status, title and theme toggle
+        header_layout = QHBoxLayout()
+        
+        # FFmpeg status
+        ffmpeg_layout = QHBoxLayout()
+        ffmpeg_layout.setAlignment(Qt.AlignLeft)
+        self.ffmpeg_status_label = QLabel("Checking FFmpeg...")
+        self.ffmpeg_status_label.setFont(_FONT_SMALL)
+        ffmpeg_layout.addWidget(self.ffmpeg_status_label)
+        header_layout.addLayout(ffmpeg_layout)
+        
+        # Title
+        self.header = QLabel("Media Downloader Pro")
+        self.header.setFont(_FONT_HEADER)
+        self.header.setAlignment(Qt.AlignCenter)
+        header_layout.addWidget(self.header, stretch=1)
+        
+        # Theme toggle
+        self.theme_btn = QPushButton()
+        self.theme_btn.setFixedSize(100, 30)
+        self.update_theme_button_text()
+        self.theme_btn.setToolTip(self.tr("Toggle light/dark mode"))
+        self.theme_btn.clicked.connect(self.toggle_theme)
+        header_layout.addWidget(self.theme_btn)
+        
+        main_layout.addLayout(header_layout)
+
+        # URL input
+        self.url_group = QGroupBox()
+        url_layout = QVBoxLayout()
+        self.url_edit = QPlainTextEdit()
+        self.url_edit.setPlaceholderText(self.tr("Paste one URL per line..."))
+        self.url_edit.setFont(_FONT_BODY)
+        url_layout.addWidget(self.url_edit)
+        self.url_group.setLayout(url_layout)
+        main_layout.addWidget(self.url_group)
+
+        # Format selection
+        self.format_group = QGroupBox()
+        format_layout = QVBoxLayout()
+        
+        self.format_combo = QComboBox()
+        formats = [
+            (self.tr("MP3 (192 kbps)"), "mp3_192"),
+            (self.tr("MP3 (320 kbps)"), "mp3_320"),
+            (self.tr("MP4 (720p)"), "mp4_720"),
+            (self.tr("MP4 (1080p)"), "mp4_1080"),
+            (self.tr("MP4 (Best quality)"), "mp4_best"),
+        ]
+        
+        for text, mode in formats:
+            self.format_combo.addItem(text, mode)
+
+        self.format_combo.setCurrentIndex(0)
+        
+        self.quality_label = QLabel()
+        format_layout.addWidget(self.quality_label)
+        format_layout.addWidget(self.format_combo)
+        
+        # Download location
+        folder_layout = QHBoxLayout()
+        self.folder_label = QLabel()
+        self.folder_label.setFont(_FONT_SMALL)
+        folder_layout.addWidget(self.folder_label)
+        
+        self.folder_btn = QPushButton()
+        self.folder_btn.clicked.connect(self.select_download_folder)
+        folder_layout.addWidget(self.folder_btn)
+        format_layout.addLayout(folder_layout)
+        
+        self.format_group.setLayout(format_layout)
+        main_layout.addWidget(self.format_group)
+
+        # Progress display
+        self.progress_group = QGroupBox()
+        progress_layout = QVBoxLayout()
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setAlignment(Qt.AlignCenter)
+        self.progress_bar.setFont(_FONT_SMALL)
+        progress_layout.addWidget(self.progress_bar)
+        
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setFont(_FONT_BODY_BOLD)
+        progress_layout.addWidget(self.status_label)
+        
+        self.progress_group.setLayout(progress_layout)
+        main_layout.addWidget(self.progress_group)
+
+        # Log output (optional)
+        self.log_checkbox = QCheckBox()
+        self.log_checkbox.setChecked(False)
+        self.log_checkbox.stateChanged.connect(self.toggle_log)
+        main_layout.addWidget(self.log_checkbox)
+        
+        self.log_group = QGroupBox()
+        self.log_group.setVisible(False)
+        log_layout = QVBoxLayout()
+        # QPlainTextEdit lays out plain text far cheaper than QTextEdit's
+        # rich-text document - appends stay fast while the log grows.
+        self.log_output = QPlainTextEdit()
+        self.log_output.setMaximumBlockCount(2000)
+        self.log_output.setReadOnly(True)
+        self.log_output.setFont(_FONT_MONO)
+        self.log_output.setWordWrapMode(QTextOption.NoWrap)
+        log_layout.addWidget(self.log_output)
+        self.log_group.setLayout(log_layout)
+        main_layout.addWidget(self.log_group)
+
+        # Button bar
+        button_layout = QHBoxLayout()
+        
+        self.download_btn = QPushButton()
+        self.download_btn.setFont(_FONT_BODY_BOLD)
+        self.download_btn.setIcon(_theme_icon("media-playback-start"))
+        self.download_btn.clicked.connect(self.start_download)
+        button_layout.addWidget(self.download_btn)
+        
+        button_layout.addStretch()
+        
+        self.cancel_btn = QPushButton()
+        self.cancel_btn.setFont(_FONT_BODY)
+        self.cancel_btn.setIcon(_theme_icon("process-stop"))
+        self.cancel_btn.clicked.connect(self.cancel_download)
+        self.cancel_btn.setEnabled(False)
+        button_layout.addWidget(self.cancel_btn)
+        
+        self.exit_btn = QPushButton()
+        self.exit_btn.setFont(_FONT_BODY)
+        self.exit_btn.setIcon(_theme_icon("application-exit"))
+        self.exit_btn.clicked.connect(self.close)
+        button_layout.addWidget(self.exit_btn)
+        
+        main_layout.addLayout(button_layout)
+
+        # Widget settings
+        self.setMinimumSize(700, 550)
+        self.url_edit.setMinimumHeight(80)
+        self.log_output.setMinimumHeight(120)
+        self.url_edit.setLineWrapMode(QPlainTextEdit.NoWrap)
+
+    def update_theme_button_text(self):
+        if self.dark_mode:
+            self.theme_btn.setText(self.tr("Light Mode"))
+            self.theme_btn.setStyleSheet(_DARK_THEME_BTN_QSS)
+        else:
+            self.theme_btn.setText(self.tr("Dark Mode"))
+            self.theme_btn.setStyleSheet(_LIGHT_THEME_BTN_QSS)
+
+    def create_menu_bar(self):
+        menubar = self.menuBar()
+        
+        # File menu
+        self.file_menu = menubar.addMenu("File")
+        self.exit_action = self.file_menu.addAction("Exit", self.close)
+        
+        # Language menu
+        self.language_menu = menubar.addMenu("Language")
+        self.language_group = QActionGroup(self)
+        
+        # One shared slot reading the action's data instead of a closure
+        # per language; adding a language is one more _LANGS entry.
+        for label, code, default in _LANGS:
+            action = self.language_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(default)
+            action.setData(code)
+            action.triggered.connect(self._on_language_triggered)
+            self.language_group.addAction(action)
+        
+        # Help menu
+        self.help_menu = menubar.addMenu("Help")
+        self.about_action = self.help_menu.addAction("About", self.show_about)
+        self.help_menu.addAction(self.tr("License"), self.show_license)
+
+    def _on_language_triggered(self):
+        self.load_language(self.sender().data())
+
+    def show_license(self):
+        # Build the dialog once and reuse it; only the theme can change
+        # between invocations.
+        if self._license_dialog is None:
+            self._license_dialog = LicenseDialog(self)
+        else:
+            self._license_dialog.apply_theme(self.dark_mode)
+        self._license_dialog.exec_()
+
+    def show_about(self):
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(self)
+        else:
+            self._about_dialog.apply_theme(self.dark_mode)
+        self._about_dialog.exec_()
+
+    def apply_dark_theme(self):
+        self.setPalette(_DARK_PALETTE)
+        self._apply_app_stylesheet(_DARK_QSS)
+
+    def apply_light_theme(self):
+        self.setPalette(self._light_palette)
+        self._apply_app_stylesheet(_LIGHT_QSS)
+
+    @staticmethod
+    def _apply_app_stylesheet(qss):
+        # Set the sheet on the application, not the main window: Qt resolves
+        # selectors once globally instead of walking the window's widget
+        # tree per toggle. setStyleSheet replaces the sheet wholesale, so
+        # one call (and one repolish) per toggle.
+        QApplication.instance().setStyleSheet(qss)
+
+    def toggle_log(self, state):
+        self.show_log = state == Qt.Checked
+        self.log_group.setVisible(self.show_log)
+        if self.show_log:
+            self._flush_log()
+
+    def select_download_folder(self):
+        folder = QFileDialog.getExistingDirectory(
+            self, 
+            self.tr("Select download folder"), 
+            self.download_folder,
+            # DontUseCustomDirectoryIcons skips the per-entry icon stat
+            # storm that can hang the picker on large or remote folders.
+            options=QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
+                    | QFileDialog.DontUseCustomDirectoryIcons
+        )
+        if folder:
+            self.download_folder = folder
+            self.folder_label.setText(self._fmt_save_loc % folder)
+            self.log(self._fmt_folder_changed % folder, _COL_INFO)
+
+    def log(self, message, color=None):
+        if not self.show_log:
+            return
+        self._log_buf.append((message, color))
+
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        # Don't pay text layout for a hidden widget; the bounded buffer
+        # keeps the most recent lines until the log is shown again.
+        if not self.log_group.isVisible():
+            return
+
+        default = _COL_TEXT_LIGHT if not self.dark_mode else _COL_TEXT_DARK
+        # Insert at the document end through a cursor with a cached per-color
+        # char format; runs of same-colored messages go in as one insert.
+        cursor = self.log_output.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        run_color = None
+        run_lines = []
+        while True:
+            entry = self._log_buf.popleft() if self._log_buf else None
+            color = entry[1] if entry and entry[1] is not None else default
+            if run_lines and (entry is None or color != run_color):
+                cursor.insertText("\n".join(run_lines) + "\n",
+                                  self._log_format(run_color))
+                run_lines = []
+            if entry is None:
+                break
+            run_color = color
+            run_lines.append(entry[0])
+        self.log_output.ensureCursorVisible()
+
+    def _log_format(self, color):
+        key = color.rgb()
+        fmt = self._log_formats.get(key)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(color)
+            self._log_formats[key] = fmt
+        return fmt
+
+    def _validate_start(self, urls):
+        """Return the first error blocking a download start, or None."""
+        if self.ffmpeg_manager.install_status != "installed":
+            return self.tr("FFmpeg is not ready. Please wait or install manually.")
+        if not urls:
+            return self.tr("No URLs entered!")
+        return None
+
+    def start_download(self):
+        # One pass over the text: lines starting with '#' are comments
+        # (handy for annotating long paste lists), everything else is
+        # tokenized by the whitespace scan.
+        urls = [u for line in self.url_edit.toPlainText().splitlines()
+                if not line.lstrip().startswith('#')
+                for u in _URL_SPLIT.findall(line)]
+        # De-duplicate while preserving order; downloading the same URL
+        # twice in one batch is never useful.
+        urls = list(dict.fromkeys(urls))
+
+        error = self._validate_start(urls)
+        if error:
+            QMessageBox.critical(self, self.tr("Error"), error)
+            return
+
+        try:
+            os.makedirs(self.download_folder, exist_ok=True)
+        except OSError as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Could not create folder: %s") % str(e))
+            return
+
+        format_type = self.format_combo.currentData()
+        self.download_thread = DownloadThread(
+            urls, 
+            self.download_folder, 
+            format_type,
+            self.ffmpeg_manager.ffmpeg_path
+        )
+        self.download_thread.update_progress.connect(self.update_progress)
+        # Explicitly queued: finished is emitted from the worker thread and
+        # must land as exactly one GUI-thread event, never run directly.
+        self.download_thread.finished.connect(
+            self.download_finished, Qt.QueuedConnection)
+        
+        # One repaint pass for the button row instead of one per setEnabled.
+        self.centralWidget().setUpdatesEnabled(False)
+        self.download_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.exit_btn.setEnabled(False)
+        self.centralWidget().setUpdatesEnabled(True)
+        self.download_thread.start()
+
+    def update_progress(self, percent, message, status=STATUS_INFO):
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress_bar.setValue(percent)
+        now = self._paint_timer.elapsed()
+        if message != self._last_msg and (
+                status != STATUS_INFO or now - self._last_status_ms > 33):
+            self._last_msg = message
+            self._last_status_ms = now
+            self.status_label.setText(message)
+        if message and self.show_log:
+            self.log(message, _STATUS_COLORS.get(status))
+
+    def download_finished(self):
+        self.centralWidget().setUpdatesEnabled(False)
+        self.download_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+        self.exit_btn.setEnabled(True)
+        self.centralWidget().setUpdatesEnabled(True)
+        self.status_label.setText(self._t_completed)
+        self.download_thread = None
+
+    def cancel_download(self):
+        # Request cancellation and return; the thread's finished signal
+        # calls download_finished once yt-dlp has unwound, so the GUI never
+        # blocks waiting for sockets to close.
+        if self.download_thread:
+            self.download_thread.stop()
+            self.log(self._t_cancelled, _COL_WARN)
+
+    def closeEvent(self, event):
+        if self.download_thread and self.download_thread.isRunning():
+            # Ask non-modally; QMessageBox.question spins a nested event
+            # loop while the worker keeps queueing signals into it.
+            if self._quit_box is None:
+                self._quit_box = QMessageBox(
+                    QMessageBox.Question,
+                    self.tr("Download in progress"),
+                    self.tr("A download is still active. Really quit?"),
+                    QMessageBox.Yes | QMessageBox.No,
+                    self
+                )
+                self._quit_box.finished.connect(self._on_quit_confirm)
+            self._quit_box.open()
+            event.ignore()
+            return
+        event.accept()
+
+    def _on_quit_confirm(self, result):
+        if result != QMessageBox.Yes:
+            return
+        self.cancel_download()
+        if self.download_thread:
+            # Close for real once the worker has unwound; download_finished
+            # runs first and clears the thread reference.
+            self.download_thread.finished.connect(self.close)
+        else:
+            self.close()
+
+    def tr(self, text):
+        return _tr(text)
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+
+    # Pre-warm the yt-dlp import (the ~300-extractor graph takes around a
+    # second) off the GUI thread so the window appears immediately and the
+    # first download doesn't stall on the import either.
+    threading.Thread(
+        target=__import__, args=("yt_dlp",), daemon=True).start()
+
+
+    locale = QLocale("en")
+    QLocale.setDefault(locale)
+    
+    window = YouTubeDownloaderApp()
+    window.show()
     sys.exit(app.exec_())
\ No newline at end of file